@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس زمن المعالج لكل استدعاء في مسار ترميز/فك ترميز طلبات TeaBank
+يقارن المسار القديم (re + json القياسية) بطبقة RequestCodec
+الاستخدام: python bench_codec.py [عدد التكرارات]
+"""
+
+import json
+import re
+import sys
+import time
+import urllib.parse
+
+from teabank_codec import JSON_BACKEND, RequestCodec
+
+
+def build_samples(iterations: int):
+    """إنشاء initData مختلفة لكل تكرار لقياس المسار البارد"""
+    samples = []
+    for i in range(iterations):
+        user = {"id": 100000000 + i, "first_name": "محمد", "last_name": "أحمد", "language_code": "ar"}
+        init_data = (
+            f"query_id=AAH{i}&user=" + urllib.parse.quote(json.dumps(user))
+            + f"&auth_date=1700000000&hash={i:064x}"
+        )
+        samples.append(init_data)
+    return samples
+
+
+def build_payload(init_data: str, user: dict) -> dict:
+    return {
+        "user": user,
+        "initData": init_data,
+        "id": str(user.get("id", "")),
+        "first_name": user.get("first_name", ""),
+        "last_name": user.get("last_name", ""),
+        "task": "checkOrRegisterUser"
+    }
+
+
+def legacy_parse(init_data: str) -> dict:
+    match = re.search(r'user=([^&]+)', init_data)
+    return json.loads(urllib.parse.unquote(match.group(1)))
+
+
+def codec_parse(init_data: str) -> dict:
+    return RequestCodec.parse_init_data(init_data).user
+
+
+def legacy_encode(payload: dict) -> bytes:
+    # ما يفعله requests عند تمرير json=
+    return json.dumps(payload, allow_nan=False).encode('utf-8')
+
+
+def legacy_decode(body: bytes):
+    # ما يفعله response.json() بعد اكتشاف الترميز
+    return json.loads(body.decode('utf-8'))
+
+
+def measure(func, args) -> float:
+    """متوسط زمن المعالج بالميكروثانية لكل استدعاء"""
+    start = time.process_time()
+    for arg in args:
+        func(arg)
+    return (time.process_time() - start) / len(args) * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    samples = build_samples(iterations)
+    payloads = [build_payload(init_data, legacy_parse(init_data)) for init_data in samples]
+    bodies = [
+        json.dumps({"token": f"{i:064x}", "status": "ok", "balance": 1234.5}).encode('utf-8')
+        for i in range(iterations)
+    ]
+
+    print(f"JSON backend: {JSON_BACKEND}, iterations: {iterations}")
+    print(f"{'stage':>8} {'legacy':>12} {'codec':>12}")
+    for stage, legacy, codec, args in (
+        ("parse", legacy_parse, codec_parse, samples),
+        ("encode", legacy_encode, RequestCodec.encode, payloads),
+        ("decode", legacy_decode, RequestCodec.decode, bodies),
+    ):
+        print(f"{stage:>8} {measure(legacy, args):>9.2f} µs {measure(codec, args):>9.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
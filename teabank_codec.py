@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+طبقة ترميز طلبات TeaBank API
+قوالب الطلبات والترويسات الجاهزة مع فك ترميز JSON سريع اختياري
+"""
+
+import json
+import re
+import urllib.parse
+from collections import namedtuple
+from typing import Any, Dict, Optional
+
+# محرك JSON سريع اختياري لفك الترميز مع الرجوع إلى مكتبة json القياسية
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    _json_loads = json.loads
+    JSON_BACKEND = "json"
+
+# نفس إعدادات requests عند استخدام json= (ASCII مع منع NaN/Infinity)
+# للإبقاء على صيغة الطلبات المرسلة كما هي، خاصة الأسماء العربية
+_json_encoder = json.JSONEncoder(allow_nan=False)
+
+ParsedInitData = namedtuple("ParsedInitData", ["user", "id", "first_name", "last_name"])
+
+
+class RequestCodec:
+    """قوالب الطلبات الجاهزة وترميز/فك ترميز JSON لـ TeaBank API"""
+
+    API_BASE = "https://api.teabank.io"
+    USER_URL = f"{API_BASE}/user-api/"
+    TASKS_URL = f"{API_BASE}/tasks-api/"
+    ADS_URL = f"{API_BASE}/ads-api/"
+
+    # ترويسات مشتركة تُبنى مرة واحدة (requests لا يعدّل القاموس الممرَّر)
+    HEADERS = {
+        'Content-Type': 'application/json',
+        'Referer': 'https://app.teabank.io/',
+        'Origin': 'https://app.teabank.io'
+    }
+
+    _USER_PATTERN = re.compile(r'user=([^&]+)')
+
+    @staticmethod
+    def encode(payload: Dict) -> bytes:
+        """ترميز الحمولة إلى JSON"""
+        return _json_encoder.encode(payload).encode('utf-8')
+
+    @staticmethod
+    def decode(body: bytes) -> Any:
+        """فك ترميز جسم الاستجابة (يُفترض أن الجسم بترميز UTF-8)"""
+        return _json_loads(body)
+
+    @staticmethod
+    def parse_init_data(init_data: str) -> Optional[ParsedInitData]:
+        """تحليل initData واستخراج بيانات المستخدم في خطوة واحدة"""
+        match = RequestCodec._USER_PATTERN.search(init_data)
+        if not match:
+            return None
+
+        user = _json_loads(urllib.parse.unquote(match.group(1)))
+        return ParsedInitData(
+            user=user,
+            id=str(user.get("id", "")),
+            first_name=user.get("first_name", ""),
+            last_name=user.get("last_name", "")
+        )
@@ -12,8 +12,6 @@ import logging
 import asyncio
 import threading
 import time
-import json
-import re
 import urllib.parse
 import requests
 import subprocess
@@ -26,6 +24,8 @@ from typing import Dict, List, Optional, Any
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
+from teabank_codec import RequestCodec
+
 # إعداد السجلات
 logging.basicConfig(
     level=logging.INFO,
@@ -66,6 +66,10 @@ class TeaBankService:
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+    def _post(self, url: str, payload: Dict) -> requests.Response:
+        """إرسال طلب POST بحمولة مرمّزة مسبقاً وترويسات مشتركة"""
+        return self.session.post(url, data=RequestCodec.encode(payload), headers=RequestCodec.HEADERS, timeout=10)
+
     def extract_init_data(self, webapp_link: str) -> Optional[Dict]:
         """استخراج بيانات التهيئة من رابط الويب"""
         try:
@@ -81,37 +85,25 @@ class TeaBankService:
     def get_token(self, extracted_data: Dict) -> Optional[str]:
         """الحصول على توكن من TeaBank"""
         try:
-            url = "https://api.teabank.io/user-api/"
-
             # استخراج بيانات المستخدم
             init_data = extracted_data["initData"]
-            match = re.search(r'user=([^&]+)', init_data)
-            if not match:
+            parsed = RequestCodec.parse_init_data(init_data)
+            if not parsed:
                 return None
 
-            user_encoded = match.group(1)
-            user_decoded = urllib.parse.unquote(user_encoded)
-            user_data = json.loads(user_decoded)
-
             payload = {
-                "user": user_data,
+                "user": parsed.user,
                 "initData": init_data,
-                "id": str(user_data.get("id", "")),
-                "first_name": user_data.get("first_name", ""),
-                "last_name": user_data.get("last_name", ""),
+                "id": parsed.id,
+                "first_name": parsed.first_name,
+                "last_name": parsed.last_name,
                 "task": "checkOrRegisterUser"
             }
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Referer': 'https://app.teabank.io/',
-                'Origin': 'https://app.teabank.io'
-            }
-
-            response = self.session.post(url, json=payload, headers=headers, timeout=10)
+            response = self._post(RequestCodec.USER_URL, payload)
 
             if response.status_code == 200:
-                data = response.json()
+                data = RequestCodec.decode(response.content)
                 return data.get('token')
 
             return None
@@ -123,23 +115,15 @@ class TeaBankService:
     def start_farming(self, init_data: str, token: str) -> Dict:
         """بدء التعدين"""
         try:
-            url = "https://api.teabank.io/user-api/"
-
             payload = {
                 "task": "startFarming",
                 "token": token
             }
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Referer': 'https://app.teabank.io/',
-                'Origin': 'https://app.teabank.io'
-            }
-
-            response = self.session.post(url, json=payload, headers=headers, timeout=10)
+            response = self._post(RequestCodec.USER_URL, payload)
 
             if response.status_code == 200:
-                data = response.json()
+                data = RequestCodec.decode(response.content)
                 return {"success": True, "data": data}
 
             return {"success": False, "error": f"HTTP {response.status_code}"}
@@ -151,8 +135,6 @@ class TeaBankService:
     def perform_task(self, init_data: str, token: str, task_id: int) -> Dict:
         """تنفيذ مهمة واحدة"""
         try:
-            url = "https://api.teabank.io/tasks-api/"
-
             task_data = {
                 "task": "completeTask",
                 "token": token,
@@ -160,16 +142,10 @@ class TeaBankService:
                 "userData": init_data
             }
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Referer': 'https://app.teabank.io/',
-                'Origin': 'https://app.teabank.io'
-            }
-
-            response = self.session.post(url, json=task_data, headers=headers, timeout=10)
+            response = self._post(RequestCodec.TASKS_URL, task_data)
 
             if response.status_code == 200:
-                return {"success": True, "data": response.json()}
+                return {"success": True, "data": RequestCodec.decode(response.content)}
             elif response.status_code == 429:
                 return {"success": False, "rate_limit": True}
             else:
@@ -181,24 +157,16 @@ class TeaBankService:
     def watch_ads(self, init_data: str, token: str) -> Dict:
         """مشاهدة الإعلانات"""
         try:
-            url = "https://api.teabank.io/ads-api/"
-
             ads_data = {
                 "task": "watchAd",
                 "token": token,
                 "userData": init_data
             }
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Referer': 'https://app.teabank.io/',
-                'Origin': 'https://app.teabank.io'
-            }
-
-            response = self.session.post(url, json=ads_data, headers=headers, timeout=10)
+            response = self._post(RequestCodec.ADS_URL, ads_data)
 
             if response.status_code == 200:
-                return {"success": True, "data": response.json()}
+                return {"success": True, "data": RequestCodec.decode(response.content)}
             else:
                 return {"success": False, "error": f"HTTP {response.status_code}"}
 